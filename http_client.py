@@ -1,26 +1,39 @@
-import os
-import requests
+import orjson
+import httpx
 from typing import Dict, Any, Optional
+from voltage_payments_api import _Config, _client_kwargs
 
 class VoltageAPIClient:
     """Client for making requests to the Voltage API."""
     
-    def __init__(self):
-        """Initialize the client with environment variables."""
-        self.base_url = os.environ.get("BASE_URL")
-        self.api_key = os.environ.get("API_KEY")
-        self.organization_id = os.environ.get("ORGANIZATION_ID")
-        self.environment_id = os.environ.get("ENVIRONMENT_ID")
+    def __init__(self, cfg: _Config = None):
+        """Initialize the client from cfg, or from environment variables if not given."""
+        if cfg is None:
+            cfg = _Config.from_env()
+        self.base_url = cfg.base_url
+        self.api_key = cfg.api_key
+        self.organization_id = cfg.organization_id
+        self.environment_id = cfg.environment_id
         
-        if not all([self.base_url, self.api_key, self.organization_id, self.environment_id]):
-            raise ValueError("Missing required environment variables: BASE_URL, API_KEY, ORGANIZATION_ID, ENVIRONMENT_ID")
-    
-    def _get_headers(self) -> Dict[str, str]:
-        """Get the headers for API requests."""
-        return {
+        self._headers = {
             "Content-Type": "application/json",
+            "Accept-Encoding": "gzip, deflate",
             "Authorization": f"Bearer {self.api_key}"
         }
+        # Endpoint URLs are relative to the client's base_url
+        self._wallets_url = f"/api/v1/organizations/{self.organization_id}/wallets"
+        
+        self._client = httpx.Client(**_client_kwargs(self.base_url, self._headers, max_connections=64))
+    
+    def close(self) -> None:
+        """Close the underlying HTTP client and release its pooled connections."""
+        self._client.close()
+    
+    def __enter__(self) -> "VoltageAPIClient":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
     
     def get_all_wallets(self) -> Dict[str, Any]:
         """
@@ -29,7 +42,6 @@ class VoltageAPIClient:
         Returns:
             Dict[str, Any]: The API response containing the wallets.
         """
-        url = f"{self.base_url}/api/v1/organizations/{self.organization_id}/wallets"
-        response = requests.get(url, headers=self._get_headers())
+        response = self._client.get(self._wallets_url)
         response.raise_for_status()
-        return response.json()
+        return orjson.loads(response.content)
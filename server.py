@@ -1,149 +1,97 @@
 # server.py
-import sys
+import functools
+import inspect
+import logging
+import os
+from typing import Callable
 from mcp.server.fastmcp import FastMCP
 from voltage_payments_api import VoltagePaymentsAPI
 
+# Log to stderr (stdout carries the MCP protocol); an unknown LOG_LEVEL falls back to INFO
+log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
+level_known = isinstance(logging.getLevelName(log_level), int)
+logging.basicConfig(level=log_level if level_known else logging.INFO)
+logger = logging.getLogger("voltage_mcp")
+if not level_known:
+    logger.warning("Unknown LOG_LEVEL %r, using INFO", log_level)
+
+# httpx logs every request line, wallet and payment IDs included, at INFO; only show those when debugging
+if logging.getLogger().getEffectiveLevel() > logging.DEBUG:
+    for name in ("httpx", "httpcore"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+# VoltagePaymentsAPI methods exposed as MCP tools, under the same names
+TOOL_METHODS = (
+    "get_all_wallets",
+    "generate_bolt11_invoice",
+    "pay_bolt11_invoice",
+    "check_payment_status",
+    "create_wallet",
+    "get_wallet",
+    "delete_wallet",
+    "get_wallet_ledger_as_user",
+    "get_wallets_with_ledgers",
+    "get_payments",
+)
+
+
+@functools.cache
+def _api() -> VoltagePaymentsAPI:
+    """Return the shared API client, creating it on the first tool call."""
+    return VoltagePaymentsAPI()
+
+
+def _make_tool(name: str) -> Callable:
+    """Build a tool function that forwards to the shared client's method of the same name."""
+    method = getattr(VoltagePaymentsAPI, name)
+
+    @functools.wraps(method)
+    def tool(*args, **kwargs):
+        return getattr(_api(), name)(*args, **kwargs)
+
+    # Expose the method's signature without self, so FastMCP builds the same tool schema
+    signature = inspect.signature(method)
+    tool.__signature__ = signature.replace(parameters=list(signature.parameters.values())[1:])
+    return tool
+
+
+def _tool_description(method: Callable) -> str:
+    """
+    Return the parts of the method's docstring that describe the tool: its summary line and Args section.
+
+    The rest of the docstring (implementation notes, Returns and Raises) is written for library callers.
+    """
+    lines = inspect.getdoc(method).splitlines()
+    description = [lines[0]]
+    if "Args:" in lines:
+        section = lines[lines.index("Args:") + 1:]
+        # The section ends at the next unindented line, i.e. the next section header
+        end = next((i for i, line in enumerate(section) if line and not line[0].isspace()), len(section))
+        description += ["", "Args:", *(line.rstrip() for line in section[:end] if line.strip())]
+    return "\n".join(description)
+
+
+def register_tools(mcp: FastMCP) -> None:
+    """
+    Register each method in TOOL_METHODS as an MCP tool.
+
+    FastMCP builds each tool's schema from the method's signature; its
+    description is the method's summary line and Args section. The API
+    client itself is only created on the first tool call, so starting or
+    introspecting the server does not read the environment or open
+    connections.
+    """
+    for name in TOOL_METHODS:
+        mcp.tool(description=_tool_description(getattr(VoltagePaymentsAPI, name)))(_make_tool(name))
+
+
 try:
     # Create an MCP server
-    print("Creating MCP server...", file=sys.stderr)
+    logger.info("Creating MCP server...")
     mcp = FastMCP("Voltage Payments API")
+    register_tools(mcp)
 
-    # Initialize the Voltage Payments API client
-    voltage_api = VoltagePaymentsAPI()
-
-    # Add a tool to get all wallets
-    @mcp.tool()
-    def get_all_wallets() -> list:
-        """Get all wallets for the organization"""
-        print("Getting all wallets...", file=sys.stderr)
-        return voltage_api.get_all_wallets()
-
-    # Add a tool to generate a BOLT11 invoice
-    @mcp.tool()
-    def generate_bolt11_invoice(wallet_id: str, amount_sats: int, memo: str = None) -> dict:
-        """
-        Generate a BOLT11 invoice for receiving a payment
-
-        Args:
-            wallet_id: The ID of the wallet to generate the invoice for
-            amount_sats: The amount in satoshis to request
-            memo: Optional description/memo for the invoice
-        """
-        print(f"Generating BOLT11 invoice for wallet {wallet_id}...", file=sys.stderr)
-        return voltage_api.generate_bolt11_invoice(wallet_id, amount_sats, memo)
-
-    # Add a tool to pay a BOLT11 invoice
-    @mcp.tool()
-    def pay_bolt11_invoice(wallet_id: str, payment_request: str, amount_sats: int = None, fee_limit_sats: int = None) -> dict:
-        """
-        Pay a BOLT11 invoice
-
-        Args:
-            wallet_id: The ID of the wallet to pay from
-            payment_request: The BOLT11 payment request string to pay
-            amount_sats: Optional amount in satoshis to pay (for zero-amount invoices)
-            fee_limit_sats: Optional maximum fee in satoshis to pay for the payment
-        """
-        print(f"Paying BOLT11 invoice from wallet {wallet_id}...", file=sys.stderr)
-        return voltage_api.pay_bolt11_invoice(wallet_id, payment_request, amount_sats, fee_limit_sats)
-
-    # Add a tool to check payment status
-    @mcp.tool()
-    def check_payment_status(payment_id: str) -> dict:
-        """
-        Check the status of a payment by its ID
-
-        Args:
-            payment_id: The ID of the payment to check
-        """
-        print(f"Checking payment status for payment {payment_id}...", file=sys.stderr)
-        return voltage_api.check_payment_status(payment_id)
-
-    # Add a tool to create a wallet
-    @mcp.tool()
-    def create_wallet(wallet_request: dict) -> dict:
-        """
-        Create a new wallet in the organization
-
-        Args:
-            wallet_request: A dictionary containing the wallet creation parameters.
-                Must include: id, environment_id, line_of_credit_id, name, network, limit
-        """
-        print(f"Creating wallet with request: {wallet_request}...", file=sys.stderr)
-        return voltage_api.create_wallet(wallet_request)
-
-    # Add a tool to get a wallet
-    @mcp.tool()
-    def get_wallet(wallet_id: str) -> dict:
-        """
-        Get a specific wallet by its ID
-
-        Args:
-            wallet_id: The ID of the wallet to retrieve
-        """
-        print(f"Getting wallet with ID: {wallet_id}...", file=sys.stderr)
-        return voltage_api.get_wallet(wallet_id)
-
-    # Add a tool to delete a wallet
-    @mcp.tool()
-    def delete_wallet(wallet_id: str) -> dict:
-        """
-        Delete a specific wallet by its ID
-
-        Args:
-            wallet_id: The ID of the wallet to delete
-        """
-        print(f"Deleting wallet with ID: {wallet_id}...", file=sys.stderr)
-        return voltage_api.delete_wallet(wallet_id)
-
-    # Add a tool to get a wallet's ledger
-    @mcp.tool()
-    def get_wallet_ledger_as_user(wallet_id: str, offset: int = None, limit: int = None, 
-                                 payment_id: str = None, start_date: str = None, end_date: str = None,
-                                 sort_key: str = None, sort_order: str = None) -> dict:
-        """
-        Get the ledger for a specific wallet by its ID
-
-        Args:
-            wallet_id: The ID of the wallet to retrieve the ledger for
-            offset: Optional, pagination offset for ledger items
-            limit: Optional, maximum number of ledger items to return
-            payment_id: Optional, filter ledger items by payment ID
-            start_date: Optional, filter ledger items by start date (ISO 8601 format)
-            end_date: Optional, filter ledger items by end date (ISO 8601 format)
-            sort_key: Optional, key to sort the ledger items by (effective_time, message_time, or time_and_effective_time)
-            sort_order: Optional, order to sort the ledger items (ASC or DESC)
-        """
-        print(f"Getting ledger for wallet with ID: {wallet_id}...", file=sys.stderr)
-        return voltage_api.get_wallet_ledger_as_user(wallet_id, offset, limit, payment_id, 
-                                                   start_date, end_date, sort_key, sort_order)
-
-    # Add a tool to get payments
-    @mcp.tool()
-    def get_payments(offset: int = None, limit: int = None, wallet_id: str = None,
-                    statuses: list = None, sort_key: str = None, sort_order: str = None,
-                    kind: str = None, direction: str = None, start_date: str = None, 
-                    end_date: str = None) -> dict:
-        """
-        Get a list of payments with optional filtering parameters
-
-        Args:
-            offset: Optional, pagination offset for payment items
-            limit: Optional, maximum number of payment items to return
-            wallet_id: Optional, filter payments by wallet ID
-            statuses: Optional, filter payments by status (list of status strings)
-            sort_key: Optional, key to sort the payments by (created_at or updated_at)
-            sort_order: Optional, order to sort the payments (ASC or DESC)
-            kind: Optional, filter payments by kind (bolt11, onchain, or bip21)
-            direction: Optional, filter payments by direction (send or receive)
-            start_date: Optional, filter payments by start date (ISO 8601 format)
-            end_date: Optional, filter payments by end date (ISO 8601 format)
-        """
-        print(f"Getting payments with filters...", file=sys.stderr)
-        return voltage_api.get_payments(offset, limit, wallet_id, statuses, sort_key, 
-                                      sort_order, kind, direction, start_date, end_date)
-
-    print("Server setup complete, ready to run", file=sys.stderr)
+    logger.info("Server setup complete, ready to run")
 except Exception as e:
-    print(f"Error setting up server: {e}", file=sys.stderr)
-    raise
\ No newline at end of file
+    logger.error("Error setting up server: %s", e)
+    raise
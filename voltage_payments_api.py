@@ -1,33 +1,437 @@
 import os
-import requests
-from typing import Dict, Any, List
+import asyncio
+import functools
+import importlib.util
+import orjson
+import httpx
+from typing import Dict, Any, AsyncIterator, Callable, Iterator, List, Optional, Tuple
+from dataclasses import dataclass
 import uuid
-import json
-import sys
+import random
 import time
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
 
-class VoltagePaymentsAPI:
+logger = logging.getLogger(__name__)
+
+# Timeout in seconds applied to every request made by the client
+REQUEST_TIMEOUT = 10
+# Longer timeout for the paginated listing endpoints, which can return large bodies
+LIST_REQUEST_TIMEOUT = 30
+# Upper bound on concurrent requests for bulk fetches; stays below the client's pool size
+MAX_CONCURRENT_REQUESTS = 8
+# Wallet reads are served from memory for this many seconds; wallets change rarely within a session
+WALLET_CACHE_TTL = 5
+WALLET_CACHE_SIZE = 128
+# Payment polling backs off exponentially from POLL_BASE_DELAY, capped at POLL_MAX_DELAY seconds
+POLL_BASE_DELAY = 0.1
+POLL_MAX_DELAY = 4.0
+# Number of items requested per page by the iter_* helpers
+PAGE_SIZE = 100
+# Reads answered with a transient gateway error are retried up to MAX_RETRIES times,
+# backing off exponentially from RETRY_BASE_DELAY seconds, capped at RETRY_MAX_DELAY
+MAX_RETRIES = 3
+RETRY_BASE_DELAY = 0.2
+RETRY_MAX_DELAY = 2.0
+
+# HTTP/2 needs the optional h2 package; without it httpx falls back to HTTP/1.1
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
+# Query parameter names accepted by the listing endpoints, in method-signature order
+_LEDGER_PARAMS = ("offset", "limit", "payment_id", "start_date", "end_date", "sort_key", "sort_order")
+_PAYMENTS_PARAMS = ("offset", "limit", "wallet_id", "statuses", "sort_key", "sort_order",
+                    "kind", "direction", "start_date", "end_date")
+
+# Responses worth retrying, and the methods that are safe to repeat after one. POSTs create payments
+# and wallets, and a DELETE that went through before the gateway error would fail its retry with 404
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_RETRY_METHODS = frozenset({"GET"})
+# Failures that happen before the request reaches the API, so any method may be retried after them
+_CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+# Environment variables that configure the clients
+_ENV_VARS = ("BASE_URL", "API_KEY", "ORGANIZATION_ID", "ENVIRONMENT_ID")
+
+@dataclass(frozen=True)
+class _Config:
+    """Voltage API connection settings, read from the environment."""
+    base_url: str
+    api_key: str
+    organization_id: str
+    environment_id: str
+
+    def __post_init__(self):
+        # Drop any trailing slash so URLs joined onto base_url do not end up with "//"
+        object.__setattr__(self, "base_url", self.base_url.rstrip("/"))
+
+    @classmethod
+    @functools.cache
+    def from_env(cls) -> "_Config":
+        """
+        Read and validate the settings from the environment.
+
+        The result is cached, so the environment is only read once per process;
+        call _Config.from_env.cache_clear() to pick up changes.
+
+        Raises:
+            ValueError: If any of the required environment variables is unset or empty.
+        """
+        values = [os.environ.get(name) for name in _ENV_VARS]
+        missing = [name for name, value in zip(_ENV_VARS, values) if not value]
+        if missing:
+            raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
+        return cls(*values)
+
+class _TTLCache:
+    """A small thread-safe cache whose entries expire a fixed time after being stored."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: Dict[Any, tuple] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Any) -> Any:
+        """Return the value cached under key, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Any, value: Any) -> None:
+        """Cache value under key, evicting the oldest entry if the cache is full."""
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self._maxsize:
+                del self._entries[next(iter(self._entries))]
+            self._entries[key] = (time.monotonic() + self._ttl, value)
+
+    def pop(self, key: Any) -> None:
+        """Drop the entry cached under key, if any."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+def _query_params(names: Tuple[str, ...], values: Tuple[Any, ...]) -> Optional[Dict[str, Any]]:
     """
-    A class to interact with the Voltage Payments API.
-    Implements specific API endpoints as methods.
+    Pair query parameter names with their values, dropping any that were not provided.
+
+    Returns None rather than an empty dict when nothing was provided, so the
+    HTTP client leaves the URL untouched for plain "list all" calls.
+    """
+    params = {k: v for k, v in zip(names, values) if v is not None}
+    return params or None
+
+def _cacheable(response: httpx.Response) -> bool:
+    """Return whether the response may be kept in the wallet cache, honoring Cache-Control: no-store."""
+    return "no-store" not in response.headers.get("Cache-Control", "").lower()
+
+def _is_json(response: httpx.Response) -> bool:
+    """Return whether the response declares a JSON body (application/json or a +json type)."""
+    media_type = response.headers.get("Content-Type", "").split(";", 1)[0].strip().lower()
+    return media_type == "application/json" or media_type.endswith("+json")
+
+def _backoff_delay(attempt: int, base_delay: float = POLL_BASE_DELAY, max_delay: float = POLL_MAX_DELAY) -> float:
+    """
+    Return how long to wait before retry number attempt (counting from 0).
+
+    Uses capped exponential backoff with full jitter, so clients polling the same
+    payment spread their requests out instead of retrying in lockstep.
     """
+    return random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+
+def _should_retry(method: str, response: httpx.Response, attempt: int) -> bool:
+    """Return whether a request that got this response should be sent again after retry number attempt."""
+    return attempt < MAX_RETRIES and method in _RETRY_METHODS and response.status_code in _RETRY_STATUSES
 
-    def __init__(self):
-        """Initialize the API client with environment variables."""
-        self.base_url = os.environ.get("BASE_URL") + "/api/v1"
-        self.api_key = os.environ.get("API_KEY")
-        self.organization_id = os.environ.get("ORGANIZATION_ID")
-        self.environment_id = os.environ.get("ENVIRONMENT_ID")
+def _client_kwargs(base_url: str, headers: Dict[str, str], max_connections: int) -> Dict[str, Any]:
+    """
+    Return the settings shared by every httpx client talking to the Voltage API.
+
+    One client is kept per API object so connections are pooled, kept alive and,
+    over HTTP/2, multiplexed. Pool and HTTP/2 settings go on the client itself:
+    a custom transport would stop httpx honoring proxy environment variables.
+    Redirects are followed, as they were with requests.
+    """
+    return {
+        "base_url": base_url,
+        "headers": headers,
+        "timeout": REQUEST_TIMEOUT,
+        "limits": httpx.Limits(max_keepalive_connections=32, max_connections=max_connections),
+        "http2": _HTTP2,
+        "follow_redirects": True,
+    }
+
+def _paginate(fetch_page: Callable[[int, int], Dict[str, Any]], page_size: int) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the items of a paginated listing, fetching one page at a time.
+
+    fetch_page(offset, limit) must return a page with "items" and "total" keys.
+    """
+    offset = 0
+    while True:
+        page = fetch_page(offset, page_size)
+        items = page.get("items", [])
+        yield from items
+        offset += len(items)
+        if not items or offset >= page.get("total", 0):
+            return
 
-        if not all([self.base_url, self.api_key, self.organization_id, self.environment_id]):
-            raise ValueError("Missing required environment variables: BASE_URL, API_KEY, ORGANIZATION_ID, ENVIRONMENT_ID")
+async def _apaginate(fetch_page: Callable, page_size: int) -> AsyncIterator[Dict[str, Any]]:
+    """Async version of _paginate; fetch_page(offset, limit) must be a coroutine function."""
+    offset = 0
+    while True:
+        page = await fetch_page(offset, page_size)
+        items = page.get("items", [])
+        for item in items:
+            yield item
+        offset += len(items)
+        if not items or offset >= page.get("total", 0):
+            return
 
-    def _get_headers(self) -> Dict[str, str]:
-        """Get the headers for API requests."""
-        return {
+def _log_request_error(error: httpx.HTTPError) -> None:
+    """Log a failed request, including the error response body when there is one."""
+    logger.error("Request error: %s", error)
+    if hasattr(error, 'response') and error.response is not None:
+        logger.error("Error response content: %s", error.response.text)
+
+class _VoltagePaymentsBase:
+    """
+    Configuration, endpoint URLs and request building shared by the sync and async clients.
+    Subclasses create the HTTP client and implement the endpoints.
+    """
+
+    def __init__(self, cfg: _Config = None):
+        """
+        Initialize the shared client state.
+
+        Args:
+            cfg: Optional connection settings; defaults to the ones read from the environment.
+
+        Raises:
+            ValueError: If cfg is not given and required environment variables are missing.
+        """
+        if cfg is None:
+            cfg = _Config.from_env()
+        self.base_url = cfg.base_url + "/api/v1"
+        self.api_key = cfg.api_key
+        self.organization_id = cfg.organization_id
+        self.environment_id = cfg.environment_id
+
+        # Headers and endpoint URLs are fixed for the lifetime of the client, so build them once
+        self._headers = {
             "Content-Type": "application/json",
-            "X-API-Key": f"{self.api_key}"
+            "Accept-Encoding": "gzip, deflate",
+            "X-API-Key": self.api_key
         }
+        # Endpoint URLs are relative to the client's base_url; the templates take wid/pid fields
+        org_url = f"/organizations/{self.organization_id}"
+        self._wallets_url = org_url + "/wallets"
+        self._wallet_url_tmpl = org_url + "/wallets/{wid}"
+        self._ledger_url_tmpl = org_url + "/wallets/{wid}/ledger"
+        self._payments_url = f"{org_url}/environments/{self.environment_id}/payments"
+        self._payment_url_tmpl = self._payments_url + "/{pid}"
+
+        # Short-lived cache for wallet reads, invalidated by wallet writes
+        self._wallet_cache = _TTLCache(maxsize=WALLET_CACHE_SIZE, ttl=WALLET_CACHE_TTL)
+
+    def invalidate_wallet(self, wallet_id: str = None) -> None:
+        """
+        Drop cached wallet data so the next read goes to the API.
+        
+        Args:
+            wallet_id: Optional, the wallet whose cached entry should be dropped.
+                The cached list of all wallets is always dropped.
+        """
+        self._wallet_cache.pop(("wallets",))
+        if wallet_id is not None:
+            self._wallet_cache.pop(("wallet", wallet_id))
+
+    @staticmethod
+    def _encode_request(method: str, url: str, payload: Any = None, params: Dict[str, Any] = None) -> Optional[bytes]:
+        """Log an outgoing request at debug level and encode its JSON body, if any."""
+        logger.debug("Request: %s %s params=%s", method, url, params)
+        if payload is None:
+            return None
+        # Serialize once; the debug log shows the exact bytes sent
+        content = orjson.dumps(payload)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Request payload: %s", content.decode())
+        return content
+
+    def _decode_response(self, response: httpx.Response, cache_key: tuple = None) -> Any:
+        """
+        Raise for HTTP errors, then decode the response body, caching it under cache_key if allowed.
+        
+        Returns:
+            Any: The decoded JSON body, or an empty dict if the body is empty.
+            
+        Raises:
+            httpx.HTTPStatusError: If the response has an error status.
+            ValueError: If the body is not JSON according to its Content-Type, or is malformed.
+        """
+        response.raise_for_status()
+        if not response.content.strip():
+            return {}
+        
+        # Trust the declared media type rather than attempting to parse arbitrary bodies
+        if not _is_json(response):
+            raise ValueError(f"Non-JSON response from API: {response.content[:200]!r}")
+        # orjson.JSONDecodeError subclasses ValueError, so malformed bodies surface as ValueError too
+        data = orjson.loads(response.content)
+        
+        if cache_key is not None and _cacheable(response):
+            # Keep the raw body so each hit decodes a fresh copy that callers are free to mutate
+            self._wallet_cache.set(cache_key, response.content)
+        return data
+
+    @staticmethod
+    def _log_response(response: httpx.Response) -> None:
+        """Log a response at debug level, decoding the body only if debug logging is enabled."""
+        logger.debug("Response status code: %s", response.status_code)
+        logger.debug("Response headers: %s", response.headers)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Response content: %s", response.text)
+
+    @staticmethod
+    def _bolt11_invoice_payload(wallet_id: str, amount_sats: int, memo: str = None) -> Tuple[str, Dict[str, Any]]:
+        """Build the payment ID and request body for receiving a BOLT11 payment."""
+        # Create a payment ID that we'll use for both creating and retrieving the payment
+        payment_id = str(uuid.uuid4())
+        
+        # Create payload according to the receive_payment_bolt11 example in the API spec,
+        # converting satoshis to millisatoshis
+        payload = {
+            "id": payment_id,
+            "wallet_id": wallet_id,
+            "currency": "btc",
+            "payment_kind": "bolt11",
+            "amount_msats": amount_sats * 1000
+        }
+        
+        if memo:
+            payload["description"] = memo
+        return payment_id, payload
+
+    @staticmethod
+    def _bolt11_payment_payload(wallet_id: str, payment_request: str, amount_sats: int = None,
+                                fee_limit_sats: int = None) -> Tuple[str, Dict[str, Any]]:
+        """Build the payment ID and request body for paying a BOLT11 invoice."""
+        # Create a payment ID that we'll use for both creating and retrieving the payment
+        payment_id = str(uuid.uuid4())
+        
+        # Create the data object for the payment according to send_payment_bolt11 example
+        data = {
+            "payment_request": payment_request
+        }
+        
+        # Convert satoshis to millisatoshis if provided
+        if amount_sats is not None:
+            data["amount_msats"] = amount_sats * 1000
+            
+        if fee_limit_sats is not None:
+            data["max_fee_msats"] = fee_limit_sats * 1000
+            
+        payload = {
+            "id": payment_id,
+            "wallet_id": wallet_id,
+            "currency": "btc",
+            "type": "bolt11",
+            "data": data
+        }
+        return payment_id, payload
+
+class VoltagePaymentsAPI(_VoltagePaymentsBase):
+    """
+    A class to interact with the Voltage Payments API.
+    Implements specific API endpoints as methods.
+    """
+
+    def __init__(self, cfg: _Config = None):
+        """
+        Initialize the API client.
+
+        Args:
+            cfg: Optional connection settings; defaults to the ones read from the environment.
+
+        Raises:
+            ValueError: If cfg is not given and required environment variables are missing.
+        """
+        super().__init__(cfg)
+
+        self._client = httpx.Client(**_client_kwargs(self.base_url, self._headers, max_connections=64))
+
+    def close(self) -> None:
+        """Close the underlying HTTP client and release its pooled connections."""
+        self._client.close()
+
+    def __enter__(self) -> "VoltagePaymentsAPI":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _request(self, method: str, url: str, *, payload: Any = None, params: Dict[str, Any] = None,
+                 timeout: Any = httpx.USE_CLIENT_DEFAULT, cache_key: tuple = None, payment_id: str = None) -> Any:
+        """
+        Send a request to the API and return the decoded JSON body.
+        
+        Args:
+            method: The HTTP method.
+            url: The endpoint URL, relative to base_url.
+            payload: Optional JSON request body.
+            params: Optional query parameters.
+            timeout: Optional timeout overriding the client default.
+            cache_key: Optional wallet cache key; a fresh cached result is returned without
+                a request, and a successful response is cached under it.
+            payment_id: Optional ID of the payment being created; if the API answers
+                202 Accepted, that payment is polled until its details are available.
+        
+        Requests that fail to connect, and GET requests answered with 502, 503
+        or 504, are retried up to MAX_RETRIES times with jittered exponential
+        backoff.
+            
+        Returns:
+            Any: The decoded JSON body, or an empty dict if the body is empty.
+            
+        Raises:
+            httpx.HTTPStatusError: If the API request fails.
+            ValueError: If the response is invalid or polling for the payment times out.
+        """
+        if cache_key is not None:
+            cached = self._wallet_cache.get(cache_key)
+            if cached is not None:
+                return orjson.loads(cached)
+        
+        content = self._encode_request(method, url, payload, params)
+        try:
+            for attempt in range(MAX_RETRIES + 1):
+                try:
+                    response = self._client.request(method, url, content=content, params=params, timeout=timeout)
+                except _CONNECT_ERRORS:
+                    if attempt == MAX_RETRIES:
+                        raise
+                    logger.debug("Could not connect, retrying %s %s...", method, url)
+                else:
+                    self._log_response(response)
+                    if not _should_retry(method, response, attempt):
+                        break
+                    logger.debug("Got %s, retrying %s %s...", response.status_code, method, url)
+                time.sleep(_backoff_delay(attempt, RETRY_BASE_DELAY, RETRY_MAX_DELAY))
+            
+            # For 202 responses, the request was accepted but we need to poll for the result
+            if payment_id is not None and response.status_code == 202:
+                logger.debug("Payment request accepted, polling for payment details...")
+                return self._poll_payment_status(payment_id)
+            
+            return self._decode_response(response, cache_key)
+        except httpx.HTTPError as e:
+            _log_request_error(e)
+            raise
 
     def get_all_wallets(self) -> List[Dict[str, Any]]:
         """
@@ -35,16 +439,15 @@ class VoltagePaymentsAPI:
 
         This method calls the 'get_all_organizations_wallets_as_user' endpoint from the API.
 
+        Results may be up to a few seconds old, since recent wallet reads are reused.
+
         Returns:
             List[Dict[str, Any]]: A list of wallet objects.
 
         Raises:
-            requests.HTTPError: If the API request fails.
+            httpx.HTTPStatusError: If the API request fails.
         """
-        url = f"{self.base_url}/organizations/{self.organization_id}/wallets"
-        response = requests.get(url, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        return self._request("GET", self._wallets_url, cache_key=("wallets",))
 
     def generate_bolt11_invoice(self, wallet_id: str, amount_sats: int, memo: str = None) -> Dict[str, Any]:
         """
@@ -59,67 +462,25 @@ class VoltagePaymentsAPI:
             Dict[str, Any]: The generated invoice data including the payment request string.
             
         Raises:
-            requests.HTTPError: If the API request fails.
+            httpx.HTTPStatusError: If the API request fails.
         """
-        try:
-            url = f"{self.base_url}/organizations/{self.organization_id}/environments/{self.environment_id}/payments"
-            print(f"Request URL: {url}", file=sys.stderr)
-            
-            # Convert satoshis to millisatoshis
-            amount_msats = amount_sats * 1000
-            
-            # Create a payment ID that we'll use for both creating and retrieving the payment
-            payment_id = str(uuid.uuid4())
-            
-            # Create payload according to the receive_payment_bolt11 example in the API spec
-            payload = {
-                "id": payment_id,
-                "wallet_id": wallet_id,
-                "currency": "btc",
-                "payment_kind": "bolt11",
-                "amount_msats": amount_msats
-            }
-            
-            if memo:
-                payload["description"] = memo
-            
-            print(f"Request payload: {json.dumps(payload)}", file=sys.stderr)
-            
-            response = requests.post(url, headers=self._get_headers(), json=payload)
-            print(f"Response status code: {response.status_code}", file=sys.stderr)
-            print(f"Response headers: {response.headers}", file=sys.stderr)
-            print(f"Response content: {response.text}", file=sys.stderr)
-            
-            # For 202 responses, the request was accepted but we need to poll for the result
-            if response.status_code == 202:
-                print(f"Payment request accepted, polling for payment details...", file=sys.stderr)
-                return self._poll_payment_status(payment_id)
-            
-            # For other successful responses, parse the JSON
-            response.raise_for_status()
-            
-            # Try to parse JSON response
-            try:
-                return response.json()
-            except json.JSONDecodeError as e:
-                print(f"JSON decode error: {e}", file=sys.stderr)
-                print(f"Response content: {response.text}", file=sys.stderr)
-                raise ValueError(f"Invalid JSON response from API: {e}")
-                
-        except requests.RequestException as e:
-            print(f"Request error: {e}", file=sys.stderr)
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"Error response content: {e.response.text}", file=sys.stderr)
-            raise
-    
-    def _poll_payment_status(self, payment_id: str, max_attempts: int = 5, delay_seconds: int = 2) -> Dict[str, Any]:
+        payment_id, payload = self._bolt11_invoice_payload(wallet_id, amount_sats, memo)
+        return self._request("POST", self._payments_url, payload=payload, payment_id=payment_id)
+
+    def _poll_payment_status(self, payment_id: str, max_attempts: int = 10, base_delay: float = POLL_BASE_DELAY,
+                             max_delay: float = POLL_MAX_DELAY) -> Dict[str, Any]:
         """
         Poll the payment status endpoint until the payment is ready or max attempts are reached.
         
+        The first attempt is made immediately. Waits between later attempts grow
+        exponentially with random jitter, so fast-settling payments are picked up
+        quickly while slow ones or API outages are not hammered.
+        
         Args:
             payment_id: The ID of the payment to poll for.
             max_attempts: Maximum number of polling attempts.
-            delay_seconds: Delay between polling attempts in seconds.
+            base_delay: Upper bound in seconds of the wait after the first attempt.
+            max_delay: Cap in seconds on the wait between attempts.
             
         Returns:
             Dict[str, Any]: The payment details.
@@ -127,37 +488,41 @@ class VoltagePaymentsAPI:
         Raises:
             ValueError: If polling times out or the payment cannot be found.
         """
-        url = f"{self.base_url}/organizations/{self.organization_id}/environments/{self.environment_id}/payments/{payment_id}"
-        print(f"Polling URL: {url}", file=sys.stderr)
+        url = self._payment_url_tmpl.format(pid=payment_id)
+        logger.debug("Polling URL: %s", url)
         
         for attempt in range(max_attempts):
             try:
-                print(f"Polling attempt {attempt + 1}/{max_attempts}...", file=sys.stderr)
-                response = requests.get(url, headers=self._get_headers())
-                print(f"Poll response status: {response.status_code}", file=sys.stderr)
+                logger.debug("Polling attempt %d/%d...", attempt + 1, max_attempts)
+                response = self._client.get(url)
+                logger.debug("Poll response status: %s", response.status_code)
                 
-                if response.status_code == 200:
+                # An empty body is a miss too, rather than payment details
+                if response.status_code == 200 and not response.content.strip():
+                    logger.debug("Payment details empty, waiting...")
+                elif response.status_code == 200:
                     try:
-                        payment_data = response.json()
-                        print(f"Payment data: {json.dumps(payment_data)}", file=sys.stderr)
+                        payment_data = self._decode_response(response)
+                    except ValueError as e:
+                        logger.debug("Invalid payment data during polling: %s", e)
+                    else:
+                        logger.debug("Payment data: %s", payment_data)
                         return payment_data
-                    except json.JSONDecodeError as e:
-                        print(f"JSON decode error during polling: {e}", file=sys.stderr)
-                        print(f"Response content: {response.text}", file=sys.stderr)
                 
                 # If we get a 404, the payment might not be ready yet
                 if response.status_code == 404:
-                    print("Payment not found yet, waiting...", file=sys.stderr)
+                    logger.debug("Payment not found yet, waiting...")
                 
-                # Wait before trying again
-                time.sleep(delay_seconds)
-                
-            except requests.RequestException as e:
-                print(f"Error during polling: {e}", file=sys.stderr)
+            except httpx.HTTPError as e:
+                logger.warning("Error during polling: %s", e)
                 # Continue polling despite errors
+            
+            # Wait before trying again, backing off further after each miss
+            if attempt + 1 < max_attempts:
+                time.sleep(_backoff_delay(attempt, base_delay, max_delay))
         
         raise ValueError(f"Failed to retrieve payment details after {max_attempts} attempts")
-    
+
     def check_payment_status(self, payment_id: str) -> Dict[str, Any]:
         """
         Check the status of a payment by its ID.
@@ -169,33 +534,10 @@ class VoltagePaymentsAPI:
             Dict[str, Any]: The payment details including its current status.
             
         Raises:
-            requests.HTTPError: If the API request fails.
+            httpx.HTTPStatusError: If the API request fails.
             ValueError: If the payment cannot be found or the response is invalid.
         """
-        try:
-            url = f"{self.base_url}/organizations/{self.organization_id}/environments/{self.environment_id}/payments/{payment_id}"
-            print(f"Checking payment status URL: {url}", file=sys.stderr)
-            
-            response = requests.get(url, headers=self._get_headers())
-            print(f"Response status code: {response.status_code}", file=sys.stderr)
-            print(f"Response headers: {response.headers}", file=sys.stderr)
-            print(f"Response content: {response.text}", file=sys.stderr)
-            
-            response.raise_for_status()
-            
-            try:
-                payment_data = response.json()
-                return payment_data
-            except json.JSONDecodeError as e:
-                print(f"JSON decode error: {e}", file=sys.stderr)
-                print(f"Response content: {response.text}", file=sys.stderr)
-                raise ValueError(f"Invalid JSON response from API: {e}")
-                
-        except requests.RequestException as e:
-            print(f"Request error: {e}", file=sys.stderr)
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"Error response content: {e.response.text}", file=sys.stderr)
-            raise
+        return self._request("GET", self._payment_url_tmpl.format(pid=payment_id))
 
     def pay_bolt11_invoice(self, wallet_id: str, payment_request: str, amount_sats: int = None, fee_limit_sats: int = None) -> Dict[str, Any]:
         """
@@ -211,63 +553,10 @@ class VoltagePaymentsAPI:
             Dict[str, Any]: The payment result data.
             
         Raises:
-            requests.HTTPError: If the API request fails.
+            httpx.HTTPStatusError: If the API request fails.
         """
-        try:
-            url = f"{self.base_url}/organizations/{self.organization_id}/environments/{self.environment_id}/payments"
-            print(f"Request URL: {url}", file=sys.stderr)
-            
-            # Create a payment ID that we'll use for both creating and retrieving the payment
-            payment_id = str(uuid.uuid4())
-            
-            # Create the data object for the payment according to send_payment_bolt11 example
-            data = {
-                "payment_request": payment_request
-            }
-            
-            # Convert satoshis to millisatoshis if provided
-            if amount_sats is not None:
-                data["amount_msats"] = amount_sats * 1000
-                
-            if fee_limit_sats is not None:
-                data["max_fee_msats"] = fee_limit_sats * 1000
-                
-            payload = {
-                "id": payment_id,
-                "wallet_id": wallet_id,
-                "currency": "btc",
-                "type": "bolt11",
-                "data": data
-            }
-            
-            print(f"Request payload: {json.dumps(payload)}", file=sys.stderr)
-            
-            response = requests.post(url, headers=self._get_headers(), json=payload)
-            print(f"Response status code: {response.status_code}", file=sys.stderr)
-            print(f"Response headers: {response.headers}", file=sys.stderr)
-            print(f"Response content: {response.text}", file=sys.stderr)
-            
-            # For 202 responses, the request was accepted but we need to poll for the result
-            if response.status_code == 202:
-                print(f"Payment request accepted, polling for payment details...", file=sys.stderr)
-                return self._poll_payment_status(payment_id)
-            
-            # For other successful responses, parse the JSON
-            response.raise_for_status()
-            
-            # Try to parse JSON response
-            try:
-                return response.json()
-            except json.JSONDecodeError as e:
-                print(f"JSON decode error: {e}", file=sys.stderr)
-                print(f"Response content: {response.text}", file=sys.stderr)
-                raise ValueError(f"Invalid JSON response from API: {e}")
-                
-        except requests.RequestException as e:
-            print(f"Request error: {e}", file=sys.stderr)
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"Error response content: {e.response.text}", file=sys.stderr)
-            raise
+        payment_id, payload = self._bolt11_payment_payload(wallet_id, payment_request, amount_sats, fee_limit_sats)
+        return self._request("POST", self._payments_url, payload=payload, payment_id=payment_id)
 
     def create_wallet(self, wallet_request: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -281,40 +570,19 @@ class VoltagePaymentsAPI:
             Dict[str, Any]: The created wallet object.
             
         Raises:
-            requests.HTTPError: If the API request fails.
+            httpx.HTTPStatusError: If the API request fails.
         """
         try:
-            url = f"{self.base_url}/organizations/{self.organization_id}/wallets"
-            print(f"Request URL: {url}", file=sys.stderr)
-            
-            print(f"Request payload: {json.dumps(wallet_request)}", file=sys.stderr)
-            
-            response = requests.post(url, headers=self._get_headers(), json=wallet_request)
-            print(f"Response status code: {response.status_code}", file=sys.stderr)
-            print(f"Response headers: {response.headers}", file=sys.stderr)
-            print(f"Response content: {response.text}", file=sys.stderr)
-            
-            # For 202 responses, the request was accepted
-            response.raise_for_status()
-            
-            # Try to parse JSON response
-            try:
-                return response.json()
-            except json.JSONDecodeError as e:
-                print(f"JSON decode error: {e}", file=sys.stderr)
-                print(f"Response content: {response.text}", file=sys.stderr)
-                raise ValueError(f"Invalid JSON response from API: {e}")
-                
-        except requests.RequestException as e:
-            print(f"Request error: {e}", file=sys.stderr)
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"Error response content: {e.response.text}", file=sys.stderr)
-            raise
+            return self._request("POST", self._wallets_url, payload=wallet_request)
+        finally:
+            self.invalidate_wallet(wallet_request.get("id"))
 
     def get_wallet(self, wallet_id: str) -> Dict[str, Any]:
         """
         Get a specific wallet by its ID.
         
+        Results may be up to a few seconds old, since recent wallet reads are reused.
+        
         Args:
             wallet_id: The ID of the wallet to retrieve.
             
@@ -322,33 +590,10 @@ class VoltagePaymentsAPI:
             Dict[str, Any]: The wallet object.
             
         Raises:
-            requests.HTTPError: If the API request fails.
+            httpx.HTTPStatusError: If the API request fails.
             ValueError: If the wallet cannot be found or the response is invalid.
         """
-        try:
-            url = f"{self.base_url}/organizations/{self.organization_id}/wallets/{wallet_id}"
-            print(f"Request URL: {url}", file=sys.stderr)
-            
-            response = requests.get(url, headers=self._get_headers())
-            print(f"Response status code: {response.status_code}", file=sys.stderr)
-            print(f"Response headers: {response.headers}", file=sys.stderr)
-            print(f"Response content: {response.text}", file=sys.stderr)
-            
-            response.raise_for_status()
-            
-            try:
-                wallet_data = response.json()
-                return wallet_data
-            except json.JSONDecodeError as e:
-                print(f"JSON decode error: {e}", file=sys.stderr)
-                print(f"Response content: {response.text}", file=sys.stderr)
-                raise ValueError(f"Invalid JSON response from API: {e}")
-                
-        except requests.RequestException as e:
-            print(f"Request error: {e}", file=sys.stderr)
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"Error response content: {e.response.text}", file=sys.stderr)
-            raise
+        return self._request("GET", self._wallet_url_tmpl.format(wid=wallet_id), cache_key=("wallet", wallet_id))
 
     def delete_wallet(self, wallet_id: str) -> Dict[str, Any]:
         """
@@ -361,37 +606,16 @@ class VoltagePaymentsAPI:
             Dict[str, Any]: The response data, typically a success message or empty.
             
         Raises:
-            requests.HTTPError: If the API request fails.
+            httpx.HTTPStatusError: If the API request fails.
             ValueError: If the wallet cannot be found or the response is invalid.
         """
         try:
-            url = f"{self.base_url}/organizations/{self.organization_id}/wallets/{wallet_id}"
-            print(f"Request URL: {url}", file=sys.stderr)
-            
-            response = requests.delete(url, headers=self._get_headers())
-            print(f"Response status code: {response.status_code}", file=sys.stderr)
-            print(f"Response headers: {response.headers}", file=sys.stderr)
-            print(f"Response content: {response.text}", file=sys.stderr)
-            
-            response.raise_for_status()
-            
-            # If the response is empty (common for DELETE operations), return a success message
-            if not response.text.strip():
-                return {"success": True, "message": f"Wallet {wallet_id} deleted successfully"}
-            
-            # Otherwise try to parse JSON response
-            try:
-                return response.json()
-            except json.JSONDecodeError as e:
-                print(f"JSON decode error: {e}", file=sys.stderr)
-                print(f"Response content: {response.text}", file=sys.stderr)
-                raise ValueError(f"Invalid JSON response from API: {e}")
-                
-        except requests.RequestException as e:
-            print(f"Request error: {e}", file=sys.stderr)
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"Error response content: {e.response.text}", file=sys.stderr)
-            raise
+            data = self._request("DELETE", self._wallet_url_tmpl.format(wid=wallet_id))
+        finally:
+            self.invalidate_wallet(wallet_id)
+        
+        # If the response is empty (common for DELETE operations), return a success message
+        return data or {"success": True, "message": f"Wallet {wallet_id} deleted successfully"}
 
     def get_wallet_ledger_as_user(self, wallet_id: str, offset: int = None, limit: int = None, 
                                  payment_id: str = None, start_date: str = None, end_date: str = None,
@@ -413,50 +637,50 @@ class VoltagePaymentsAPI:
             Dict[str, Any]: The wallet ledger object containing items, offset, limit, and total.
             
         Raises:
-            requests.HTTPError: If the API request fails.
+            httpx.HTTPStatusError: If the API request fails.
             ValueError: If the wallet cannot be found or the response is invalid.
         """
-        try:
-            url = f"{self.base_url}/organizations/{self.organization_id}/wallets/{wallet_id}/ledger"
-            print(f"Request URL: {url}", file=sys.stderr)
-            
-            # Build query parameters
-            params = {}
-            if offset is not None:
-                params['offset'] = offset
-            if limit is not None:
-                params['limit'] = limit
-            if payment_id is not None:
-                params['payment_id'] = payment_id
-            if start_date is not None:
-                params['start_date'] = start_date
-            if end_date is not None:
-                params['end_date'] = end_date
-            if sort_key is not None:
-                params['sort_key'] = sort_key
-            if sort_order is not None:
-                params['sort_order'] = sort_order
-            
-            response = requests.get(url, headers=self._get_headers(), params=params)
-            print(f"Response status code: {response.status_code}", file=sys.stderr)
-            print(f"Response headers: {response.headers}", file=sys.stderr)
-            print(f"Response content: {response.text}", file=sys.stderr)
-            
-            response.raise_for_status()
+        params = _query_params(_LEDGER_PARAMS, (offset, limit, payment_id, start_date, end_date,
+                                                 sort_key, sort_order))
+        return self._request("GET", self._ledger_url_tmpl.format(wid=wallet_id), params=params,
+                             timeout=LIST_REQUEST_TIMEOUT)
+
+    def get_wallets_with_ledgers(self, wallet_ids: List[str], offset: int = None, limit: int = None,
+                                 payment_id: str = None, start_date: str = None, end_date: str = None,
+                                 sort_key: str = None, sort_order: str = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the ledgers for several wallets at once.
+        
+        The ledgers are fetched concurrently over the shared connection pool, so this
+        takes roughly as long as the slowest single ledger request rather than their sum.
+        
+        Args:
+            wallet_ids: The IDs of the wallets to retrieve ledgers for.
+            offset: Optional, pagination offset for ledger items, applied to every wallet.
+            limit: Optional, maximum number of ledger items to return per wallet.
+            payment_id: Optional, filter ledger items by payment ID.
+            start_date: Optional, filter ledger items by start date (ISO 8601 format).
+            end_date: Optional, filter ledger items by end date (ISO 8601 format).
+            sort_key: Optional, key to sort the ledger items by (effective_time, message_time, or time_and_effective_time).
+            sort_order: Optional, order to sort the ledger items (asc or desc).
             
-            try:
-                ledger_data = response.json()
-                return ledger_data
-            except json.JSONDecodeError as e:
-                print(f"JSON decode error: {e}", file=sys.stderr)
-                print(f"Response content: {response.text}", file=sys.stderr)
-                raise ValueError(f"Invalid JSON response from API: {e}")
-                
-        except requests.RequestException as e:
-            print(f"Request error: {e}", file=sys.stderr)
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"Error response content: {e.response.text}", file=sys.stderr)
-            raise
+        Returns:
+            Dict[str, Dict[str, Any]]: A mapping of wallet ID to that wallet's ledger object.
+            
+        Raises:
+            httpx.HTTPStatusError: If any of the API requests fail.
+            ValueError: If a wallet cannot be found or a response is invalid.
+        """
+        if not wallet_ids:
+            return {}
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_REQUESTS, len(wallet_ids))) as executor:
+            futures = {
+                wallet_id: executor.submit(self.get_wallet_ledger_as_user, wallet_id, offset, limit,
+                                           payment_id, start_date, end_date, sort_key, sort_order)
+                for wallet_id in wallet_ids
+            }
+            return {wallet_id: future.result() for wallet_id, future in futures.items()}
 
     def get_payments(self, offset: int = None, limit: int = None, wallet_id: str = None,
                     statuses: List[str] = None, sort_key: str = None, sort_order: str = None,
@@ -481,53 +705,275 @@ class VoltagePaymentsAPI:
             Dict[str, Any]: The payments object containing items, offset, limit, and total.
             
         Raises:
-            requests.HTTPError: If the API request fails.
+            httpx.HTTPStatusError: If the API request fails.
             ValueError: If the response is invalid.
         """
+        params = _query_params(_PAYMENTS_PARAMS, (offset, limit, wallet_id, statuses, sort_key, sort_order,
+                                                   kind, direction, start_date, end_date))
+        return self._request("GET", self._payments_url, params=params, timeout=LIST_REQUEST_TIMEOUT)
+
+    def iter_wallet_ledger(self, wallet_id: str, page_size: int = PAGE_SIZE, payment_id: str = None,
+                           start_date: str = None, end_date: str = None, sort_key: str = None,
+                           sort_order: str = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every item in a wallet's ledger, fetching it one page at a time.
+        
+        Only one page is held in memory at once, and items can be processed as soon
+        as their page arrives. Use get_wallet_ledger_as_user for a single page.
+        
+        Args:
+            wallet_id: The ID of the wallet to retrieve the ledger for.
+            page_size: Optional, number of ledger items to request per page.
+            payment_id: Optional, filter ledger items by payment ID.
+            start_date: Optional, filter ledger items by start date (ISO 8601 format).
+            end_date: Optional, filter ledger items by end date (ISO 8601 format).
+            sort_key: Optional, key to sort the ledger items by (effective_time, message_time, or time_and_effective_time).
+            sort_order: Optional, order to sort the ledger items (asc or desc).
+            
+        Yields:
+            Dict[str, Any]: Each ledger item.
+            
+        Raises:
+            httpx.HTTPStatusError: If an API request fails.
+            ValueError: If the wallet cannot be found or a response is invalid.
+        """
+        return _paginate(
+            lambda offset, limit: self.get_wallet_ledger_as_user(wallet_id, offset, limit, payment_id,
+                                                                 start_date, end_date, sort_key, sort_order),
+            page_size,
+        )
+
+    def iter_payments(self, page_size: int = PAGE_SIZE, wallet_id: str = None, statuses: List[str] = None,
+                      sort_key: str = None, sort_order: str = None, kind: str = None, direction: str = None,
+                      start_date: str = None, end_date: str = None) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every payment matching the filters, fetching them one page at a time.
+        
+        Only one page is held in memory at once, and payments can be processed as soon
+        as their page arrives. Use get_payments for a single page.
+        
+        Args:
+            page_size: Optional, number of payments to request per page.
+            wallet_id: Optional, filter payments by wallet ID.
+            statuses: Optional, filter payments by status (list of status strings).
+            sort_key: Optional, key to sort the payments by (created_at or updated_at).
+            sort_order: Optional, order to sort the payments (ASC or DESC).
+            kind: Optional, filter payments by kind (bolt11, onchain, or bip21).
+            direction: Optional, filter payments by direction (send or receive).
+            start_date: Optional, filter payments by start date (ISO 8601 format).
+            end_date: Optional, filter payments by end date (ISO 8601 format).
+            
+        Yields:
+            Dict[str, Any]: Each payment.
+            
+        Raises:
+            httpx.HTTPStatusError: If an API request fails.
+            ValueError: If a response is invalid.
+        """
+        return _paginate(
+            lambda offset, limit: self.get_payments(offset, limit, wallet_id, statuses, sort_key, sort_order,
+                                                    kind, direction, start_date, end_date),
+            page_size,
+        )
+
+class AsyncVoltagePaymentsAPI(_VoltagePaymentsBase):
+    """
+    An asyncio client for the Voltage Payments API.
+    Mirrors VoltagePaymentsAPI, with every endpoint method as a coroutine so that
+    independent calls can run concurrently over one connection pool.
+    """
+
+    def __init__(self, cfg: _Config = None):
+        """
+        Initialize the async API client.
+
+        Args:
+            cfg: Optional connection settings; defaults to the ones read from the environment.
+
+        Raises:
+            ValueError: If cfg is not given and required environment variables are missing.
+        """
+        super().__init__(cfg)
+
+        # Coroutines share the client concurrently, so allow more connections than the sync client
+        self._client = httpx.AsyncClient(**_client_kwargs(self.base_url, self._headers, max_connections=100))
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client and release its pooled connections."""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncVoltagePaymentsAPI":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+    async def _request(self, method: str, url: str, *, payload: Any = None, params: Dict[str, Any] = None,
+                       timeout: Any = httpx.USE_CLIENT_DEFAULT, cache_key: tuple = None, payment_id: str = None) -> Any:
+        """Async version of VoltagePaymentsAPI._request."""
+        if cache_key is not None:
+            cached = self._wallet_cache.get(cache_key)
+            if cached is not None:
+                return orjson.loads(cached)
+        
+        content = self._encode_request(method, url, payload, params)
         try:
-            url = f"{self.base_url}/organizations/{self.organization_id}/environments/{self.environment_id}/payments"
-            print(f"Request URL: {url}", file=sys.stderr)
-            
-            # Build query parameters
-            params = {}
-            if offset is not None:
-                params['offset'] = offset
-            if limit is not None:
-                params['limit'] = limit
-            if wallet_id is not None:
-                params['wallet_id'] = wallet_id
-            if statuses is not None:
-                params['statuses'] = statuses
-            if sort_key is not None:
-                params['sort_key'] = sort_key
-            if sort_order is not None:
-                params['sort_order'] = sort_order
-            if kind is not None:
-                params['kind'] = kind
-            if direction is not None:
-                params['direction'] = direction
-            if start_date is not None:
-                params['start_date'] = start_date
-            if end_date is not None:
-                params['end_date'] = end_date
-            
-            response = requests.get(url, headers=self._get_headers(), params=params)
-            print(f"Response status code: {response.status_code}", file=sys.stderr)
-            print(f"Response headers: {response.headers}", file=sys.stderr)
-            print(f"Response content: {response.text}", file=sys.stderr)
-            
-            response.raise_for_status()
+            for attempt in range(MAX_RETRIES + 1):
+                try:
+                    response = await self._client.request(method, url, content=content, params=params, timeout=timeout)
+                except _CONNECT_ERRORS:
+                    if attempt == MAX_RETRIES:
+                        raise
+                    logger.debug("Could not connect, retrying %s %s...", method, url)
+                else:
+                    self._log_response(response)
+                    if not _should_retry(method, response, attempt):
+                        break
+                    logger.debug("Got %s, retrying %s %s...", response.status_code, method, url)
+                await asyncio.sleep(_backoff_delay(attempt, RETRY_BASE_DELAY, RETRY_MAX_DELAY))
+            
+            # For 202 responses, the request was accepted but we need to poll for the result
+            if payment_id is not None and response.status_code == 202:
+                logger.debug("Payment request accepted, polling for payment details...")
+                return await self._poll_payment_status(payment_id)
             
+            return self._decode_response(response, cache_key)
+        except httpx.HTTPError as e:
+            _log_request_error(e)
+            raise
+
+    async def get_all_wallets(self) -> List[Dict[str, Any]]:
+        """Async version of VoltagePaymentsAPI.get_all_wallets."""
+        return await self._request("GET", self._wallets_url, cache_key=("wallets",))
+
+    async def generate_bolt11_invoice(self, wallet_id: str, amount_sats: int, memo: str = None) -> Dict[str, Any]:
+        """Async version of VoltagePaymentsAPI.generate_bolt11_invoice."""
+        payment_id, payload = self._bolt11_invoice_payload(wallet_id, amount_sats, memo)
+        return await self._request("POST", self._payments_url, payload=payload, payment_id=payment_id)
+
+    async def _poll_payment_status(self, payment_id: str, max_attempts: int = 10, base_delay: float = POLL_BASE_DELAY,
+                                   max_delay: float = POLL_MAX_DELAY) -> Dict[str, Any]:
+        """
+        Async version of VoltagePaymentsAPI._poll_payment_status.
+
+        Waits between attempts with asyncio.sleep, so other coroutines keep running while a payment settles.
+        """
+        url = self._payment_url_tmpl.format(pid=payment_id)
+        logger.debug("Polling URL: %s", url)
+        
+        for attempt in range(max_attempts):
             try:
-                payments_data = response.json()
-                return payments_data
-            except json.JSONDecodeError as e:
-                print(f"JSON decode error: {e}", file=sys.stderr)
-                print(f"Response content: {response.text}", file=sys.stderr)
-                raise ValueError(f"Invalid JSON response from API: {e}")
+                logger.debug("Polling attempt %d/%d...", attempt + 1, max_attempts)
+                response = await self._client.get(url)
+                logger.debug("Poll response status: %s", response.status_code)
                 
-        except requests.RequestException as e:
-            print(f"Request error: {e}", file=sys.stderr)
-            if hasattr(e, 'response') and e.response is not None:
-                print(f"Error response content: {e.response.text}", file=sys.stderr)
-            raise
+                # An empty body is a miss too, rather than payment details
+                if response.status_code == 200 and not response.content.strip():
+                    logger.debug("Payment details empty, waiting...")
+                elif response.status_code == 200:
+                    try:
+                        payment_data = self._decode_response(response)
+                    except ValueError as e:
+                        logger.debug("Invalid payment data during polling: %s", e)
+                    else:
+                        logger.debug("Payment data: %s", payment_data)
+                        return payment_data
+                
+                # If we get a 404, the payment might not be ready yet
+                if response.status_code == 404:
+                    logger.debug("Payment not found yet, waiting...")
+                
+            except httpx.HTTPError as e:
+                logger.warning("Error during polling: %s", e)
+                # Continue polling despite errors
+            
+            # Wait before trying again, backing off further after each miss
+            if attempt + 1 < max_attempts:
+                await asyncio.sleep(_backoff_delay(attempt, base_delay, max_delay))
+        
+        raise ValueError(f"Failed to retrieve payment details after {max_attempts} attempts")
+
+    async def check_payment_status(self, payment_id: str) -> Dict[str, Any]:
+        """Async version of VoltagePaymentsAPI.check_payment_status."""
+        return await self._request("GET", self._payment_url_tmpl.format(pid=payment_id))
+
+    async def pay_bolt11_invoice(self, wallet_id: str, payment_request: str, amount_sats: int = None,
+                                 fee_limit_sats: int = None) -> Dict[str, Any]:
+        """Async version of VoltagePaymentsAPI.pay_bolt11_invoice."""
+        payment_id, payload = self._bolt11_payment_payload(wallet_id, payment_request, amount_sats, fee_limit_sats)
+        return await self._request("POST", self._payments_url, payload=payload, payment_id=payment_id)
+
+    async def create_wallet(self, wallet_request: Dict[str, Any]) -> Dict[str, Any]:
+        """Async version of VoltagePaymentsAPI.create_wallet."""
+        try:
+            return await self._request("POST", self._wallets_url, payload=wallet_request)
+        finally:
+            self.invalidate_wallet(wallet_request.get("id"))
+
+    async def get_wallet(self, wallet_id: str) -> Dict[str, Any]:
+        """Async version of VoltagePaymentsAPI.get_wallet."""
+        return await self._request("GET", self._wallet_url_tmpl.format(wid=wallet_id), cache_key=("wallet", wallet_id))
+
+    async def delete_wallet(self, wallet_id: str) -> Dict[str, Any]:
+        """Async version of VoltagePaymentsAPI.delete_wallet."""
+        try:
+            data = await self._request("DELETE", self._wallet_url_tmpl.format(wid=wallet_id))
+        finally:
+            self.invalidate_wallet(wallet_id)
+        
+        # If the response is empty (common for DELETE operations), return a success message
+        return data or {"success": True, "message": f"Wallet {wallet_id} deleted successfully"}
+
+    async def get_wallet_ledger_as_user(self, wallet_id: str, offset: int = None, limit: int = None,
+                                        payment_id: str = None, start_date: str = None, end_date: str = None,
+                                        sort_key: str = None, sort_order: str = None) -> Dict[str, Any]:
+        """Async version of VoltagePaymentsAPI.get_wallet_ledger_as_user."""
+        params = _query_params(_LEDGER_PARAMS, (offset, limit, payment_id, start_date, end_date,
+                                                 sort_key, sort_order))
+        return await self._request("GET", self._ledger_url_tmpl.format(wid=wallet_id), params=params,
+                                   timeout=LIST_REQUEST_TIMEOUT)
+
+    async def get_wallets_with_ledgers(self, wallet_ids: List[str], offset: int = None, limit: int = None,
+                                       payment_id: str = None, start_date: str = None, end_date: str = None,
+                                       sort_key: str = None, sort_order: str = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Async version of VoltagePaymentsAPI.get_wallets_with_ledgers.
+
+        All ledger requests are issued at once with asyncio.gather; the client's
+        connection limits bound how many are in flight.
+        """
+        ledgers = await asyncio.gather(*(
+            self.get_wallet_ledger_as_user(wallet_id, offset, limit, payment_id,
+                                           start_date, end_date, sort_key, sort_order)
+            for wallet_id in wallet_ids
+        ))
+        return dict(zip(wallet_ids, ledgers))
+
+    async def get_payments(self, offset: int = None, limit: int = None, wallet_id: str = None,
+                           statuses: List[str] = None, sort_key: str = None, sort_order: str = None,
+                           kind: str = None, direction: str = None, start_date: str = None,
+                           end_date: str = None) -> Dict[str, Any]:
+        """Async version of VoltagePaymentsAPI.get_payments."""
+        params = _query_params(_PAYMENTS_PARAMS, (offset, limit, wallet_id, statuses, sort_key, sort_order,
+                                                   kind, direction, start_date, end_date))
+        return await self._request("GET", self._payments_url, params=params, timeout=LIST_REQUEST_TIMEOUT)
+
+    def iter_wallet_ledger(self, wallet_id: str, page_size: int = PAGE_SIZE, payment_id: str = None,
+                           start_date: str = None, end_date: str = None, sort_key: str = None,
+                           sort_order: str = None) -> AsyncIterator[Dict[str, Any]]:
+        """Async version of VoltagePaymentsAPI.iter_wallet_ledger; use with 'async for'."""
+        return _apaginate(
+            lambda offset, limit: self.get_wallet_ledger_as_user(wallet_id, offset, limit, payment_id,
+                                                                 start_date, end_date, sort_key, sort_order),
+            page_size,
+        )
+
+    def iter_payments(self, page_size: int = PAGE_SIZE, wallet_id: str = None, statuses: List[str] = None,
+                      sort_key: str = None, sort_order: str = None, kind: str = None, direction: str = None,
+                      start_date: str = None, end_date: str = None) -> AsyncIterator[Dict[str, Any]]:
+        """Async version of VoltagePaymentsAPI.iter_payments; use with 'async for'."""
+        return _apaginate(
+            lambda offset, limit: self.get_payments(offset, limit, wallet_id, statuses, sort_key, sort_order,
+                                                    kind, direction, start_date, end_date),
+            page_size,
+        )